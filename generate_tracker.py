@@ -4,25 +4,81 @@ Minimal Elegant LeetCode Tracker Generator
 Creates a clean, modern HTML tracker with auto GitHub sync
 """
 
+import io
 import re
 import json
+import hashlib
+import string
+import functools
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, TextIO
 from dataclasses import dataclass
 
-@dataclass
+# Precompiled patterns used for problem slugs
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_DASH_RE = re.compile(r'[-\s]+')
+
+# Day markers, section headers and the line-lexer states of MarkdownParser
+_DAY_MARKER = '**💥 MACHINE MODE: DAY '
+_DSA_HEADER = '🎯 **DSA:'
+_SD_HEADER = '🧠 **SYSTEM DESIGN:'
+_OUTSIDE, _IN_DSA, _IN_SD = range(3)
+
+# Goal markers, e.g. `📌 Goal: ...`; both are the same length
+_GOAL_MARKERS = ('📌 Goal:', '🎯 Goal:')
+_GOAL_MARKER_LEN = len(_GOAL_MARKERS[0])
+
+# Day titles, indexed by global day number
+_DAY_TITLES = tuple(f"Day {i}" for i in range(200))
+
+# ASCII slug table: lowercases letters and drops punctuation in one pass
+_SLUG_TABLE = str.maketrans(
+    string.ascii_uppercase,
+    string.ascii_lowercase,
+    ''.join(c for c in map(chr, range(128)) if not (c.isalnum() or c.isspace() or c in '_-')),
+)
+
+# Known easy problems
+_EASY_PROBLEMS = frozenset({1, 13, 20, 21, 26, 27, 35, 53, 58, 66, 70, 88, 104, 121, 125, 136, 141, 155,
+                            169, 206, 217, 242, 268, 283, 344, 349, 485, 509, 704, 724, 232, 225, 682})
+
+# Known hard problems
+_HARD_PROBLEMS = frozenset({10, 23, 25, 30, 37, 42, 51, 72, 76, 84, 124, 140, 212, 239, 295, 297,
+                            684, 685, 1135, 1489, 1579, 1697, 1349, 778})
+
+@functools.lru_cache(maxsize=None)
+def _title_to_slug(title: str) -> str:
+    """Convert problem title to URL slug."""
+    if title.isascii():
+        slug = title.translate(_SLUG_TABLE)
+    else:
+        slug = _SLUG_STRIP_RE.sub('', title.lower())
+    return _SLUG_DASH_RE.sub('-', slug).strip('-')
+
+def _goal_index(text: str) -> int:
+    """Return the offset of the first goal marker in `text`, or -1."""
+    found = [i for marker in _GOAL_MARKERS if (i := text.find(marker)) >= 0]
+    return min(found, default=-1)
+
+@dataclass(slots=True)
 class Problem:
     number: str
     title: str
     difficulty: str
-    url: str
-
-@dataclass
+    
+    @property
+    def url(self) -> str:
+        """LeetCode URL for numbered problems, '#' for general tasks."""
+        if not self.number:
+            return "#"
+        return f"https://leetcode.com/problems/{_title_to_slug(self.title)}/"
+
+@dataclass(slots=True)
 class Task:
     description: str
     is_bonus: bool = False
 
-@dataclass
+@dataclass(slots=True)
 class Day:
     number: int
     title: str
@@ -32,7 +88,7 @@ class Day:
     system_design_title: str
     system_design_tasks: List[Task]
 
-@dataclass
+@dataclass(slots=True)
 class Week:
     number: int
     title: str
@@ -46,159 +102,223 @@ class MarkdownParser:
     def parse(self) -> List[Week]:
         """Parse the markdown content and extract structured data."""
         
-        # Split content by weeks
-        week_sections = re.split(r'^## WEEK \d+:', self.content, flags=re.MULTILINE)[1:]
+        # Split content by weeks, dropping the preamble and each "N:" prefix
+        week_sections = [
+            part.partition(':')[2]
+            for part in ('\n' + self.content).split('\n## WEEK ')[1:]
+        ]
         
-        for i, week_section in enumerate(week_sections, 1):
-            week = self._parse_week(i, week_section)
-            if week:
-                self.weeks.append(week)
-                
+        self.weeks = [
+            week for i, week_section in enumerate(week_sections, 1)
+            if (week := self._parse_week(i, week_section))
+        ]
         return self.weeks
     
     def _parse_week(self, week_num: int, content: str) -> Week:
         """Parse a single week section."""
-        lines = content.strip().split('\n')
-        
         # Extract week title
-        title_line = lines[0].strip()
-        title_match = re.search(r'(.+?)\s*\(', title_line)
-        if title_match:
-            week_title = title_match.group(1).strip()
-        else:
-            week_title = title_line
+        title_line = content.lstrip().partition('\n')[0].strip()
+        paren = title_line.find('(')
+        week_title = title_line[:paren].rstrip() if paren > 0 else title_line
         
-        # Find all day sections
-        day_sections = re.split(r'\*\*💥 MACHINE MODE: DAY \d+', content)[1:]
-        
-        days = []
-        for i, day_section in enumerate(day_sections):
-            # Calculate global day number: (week-1) * 7 + day_in_week
-            global_day_num = (week_num - 1) * 7 + (i + 1)
-            day = self._parse_day(global_day_num, day_section)
-            if day:
-                days.append(day)
+        # Split on the day markers and drop each marker's day number;
+        # global day number is (week-1) * 7 + day_in_week
+        first_day = (week_num - 1) * 7
+        days = [
+            self._parse_day(first_day + i, body.lstrip(string.digits))
+            for i, body in enumerate(content.split(_DAY_MARKER)[1:], 1)
+        ]
         
         return Week(week_num, week_title, days)
     
     def _parse_day(self, global_day_num: int, content: str) -> Day:
         """Parse a single day section."""
-        lines = content.strip().split('\n')
-        
         # Just use the day number - no dates
-        day_title = f"Day {global_day_num}"
+        if global_day_num < len(_DAY_TITLES):
+            day_title = _DAY_TITLES[global_day_num]
+        else:
+            day_title = f"Day {global_day_num}"
+        
+        # Walk the lines once, switching state on section headers and
+        # collecting bullets (and the DSA goal) for the current section
+        dsa_title = sd_title = dsa_goal = ""
+        dsa_bullets, sd_bullets = [], []
+        seen_dsa = seen_sd = False
+        state = _OUTSIDE
+        for line in content.splitlines():
+            if line.startswith(_DSA_HEADER):
+                state = _OUTSIDE if seen_dsa else _IN_DSA
+                if not seen_dsa:
+                    seen_dsa = True
+                    dsa_title = self._header_title(line, _DSA_HEADER)
+            elif line.startswith('🧠'):
+                state = _OUTSIDE
+                if line.startswith(_SD_HEADER) and not seen_sd:
+                    seen_sd = True
+                    state = _IN_SD
+                    sd_title = self._header_title(line, _SD_HEADER)
+            elif line.startswith('---'):
+                state = _OUTSIDE
+            elif state == _IN_DSA:
+                if not dsa_goal and 'Goal:' in line:
+                    g = _goal_index(line)
+                    if g >= 0:
+                        dsa_goal = line[g + _GOAL_MARKER_LEN:].strip()
+                bullet = line.lstrip()
+                if bullet.startswith('* ') and len(bullet) > 2:
+                    dsa_bullets.append(bullet[2:])
+            elif state == _IN_SD:
+                bullet = line.lstrip()
+                if bullet.startswith('* ') and len(bullet) > 2:
+                    sd_bullets.append(bullet[2:])
         
         # Parse DSA section
-        dsa_title, dsa_problems, dsa_goal = self._parse_dsa_section(content)
+        dsa_problems, dsa_goal = self._parse_dsa_section(dsa_bullets, dsa_goal)
         
         # Parse System Design section
-        sd_title, sd_tasks = self._parse_system_design_section(content)
+        sd_tasks = self._parse_system_design_section(sd_bullets)
         
         return Day(global_day_num, day_title, dsa_title, dsa_problems, dsa_goal, sd_title, sd_tasks)
     
-    def _parse_dsa_section(self, content: str):
-        """Parse DSA section and extract all tasks/problems."""
-        # Find DSA section - look for 🎯 **DSA: pattern
-        dsa_match = re.search(r'🎯 \*\*DSA: (.+?)\*\*\n(.*?)(?=🧠|\Z)', content, re.DOTALL)
-        if not dsa_match:
-            return "", [], ""
-        
-        dsa_title = dsa_match.group(1).strip()
-        dsa_content = dsa_match.group(2).strip()
-        
+    @staticmethod
+    def _header_title(line: str, header: str) -> str:
+        """Return the title text of a `🎯 **DSA: ...**` style header line."""
+        return line[len(header):].rstrip().removesuffix('**').strip()
+    
+    def _parse_dsa_section(self, bullets: List[str], goal: str):
+        """Turn the DSA section's bullets into tasks/problems."""
         problems = []
-        goal = ""
+        append = problems.append
+        guess = self._guess_difficulty
         
-        # Extract goal - look for 📌 Goal: pattern or 🎯 Goal: pattern
-        goal_match = re.search(r'[📌🎯] Goal: (.+)', dsa_content)
-        if goal_match:
-            goal = goal_match.group(1).strip()
-        
-        # Extract ALL bullet points as trackable items
-        bullet_matches = re.findall(r'\* (.+)', dsa_content)
-        for item_text in bullet_matches:
+        # Every bullet point is a trackable item
+        for item_text in bullets:
             # Skip if this line contains the goal
             if 'Goal:' in item_text:
                 # Extract goal from this line if not already found
                 if not goal:
-                    goal_in_line = re.search(r'[📌🎯] Goal: (.+)', item_text)
-                    if goal_in_line:
-                        goal = goal_in_line.group(1).strip()
-                    # Remove the goal part and keep the main task
-                    item_text = re.sub(r'\s*[📌🎯] Goal:.*', '', item_text).strip()
+                    g = _goal_index(item_text)
+                    if g >= 0:
+                        goal = item_text[g + _GOAL_MARKER_LEN:].strip()
+                        # Remove the goal part and keep the main task
+                        item_text = item_text[:g]
+                    item_text = item_text.strip()
                     if not item_text:  # If nothing left after removing goal
                         continue
                 
             # Check if it's a LeetCode problem (LC 123: format)
-            lc_match = re.match(r'LC (\d+): (.+)', item_text)
-            if lc_match:
-                number, title = lc_match.groups()
-                difficulty = self._guess_difficulty(int(number))
-                url = f"https://leetcode.com/problems/{self._title_to_slug(title)}/"
-                problems.append(Problem(number, title, difficulty, url))
+            number = title = ""
+            if item_text.startswith('LC '):
+                number, _, title = item_text[3:].partition(': ')
+            if number.isdecimal() and title:
+                append(Problem(number, title, guess(number)))
             else:
                 # Treat as a general task/problem
-                problems.append(Problem("", item_text, "task", "#"))
-        
-        return dsa_title, problems, goal
-    
-    def _parse_system_design_section(self, content: str):
-        """Parse System Design section and extract tasks."""
-        sd_match = re.search(r'🧠 \*\*SYSTEM DESIGN: (.+?)\*\*\n(.*?)(?=---|\Z)', content, re.DOTALL)
-        if not sd_match:
-            return "", []
-        
-        sd_title = sd_match.group(1).strip()
-        sd_content = sd_match.group(2).strip()
-        
-        tasks = []
-        
-        # Extract tasks - look for * Task: or * Watch: or * Bonus: patterns
-        task_matches = re.findall(r'\* (.+)', sd_content)
-        for task_text in task_matches:
-            is_bonus = task_text.startswith('Bonus:')
-            tasks.append(Task(task_text, is_bonus))
+                append(Problem("", item_text, "task"))
         
-        return sd_title, tasks
+        return problems, goal
     
-    def _title_to_slug(self, title: str) -> str:
-        """Convert problem title to URL slug."""
-        slug = title.lower()
-        slug = re.sub(r'[^\w\s-]', '', slug)
-        slug = re.sub(r'[-\s]+', '-', slug)
-        return slug.strip('-')
+    def _parse_system_design_section(self, bullets: List[str]):
+        """Turn the System Design section's bullets into tasks."""
+        # Bullets look like * Task: / * Watch: / * Bonus:
+        return [Task(text, text.startswith('Bonus:')) for text in bullets]
     
-    def _guess_difficulty(self, problem_num: int) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _guess_difficulty(number: str) -> str:
         """Simple difficulty guessing based on common patterns."""
-        # Known easy problems
-        easy_problems = {1, 13, 20, 21, 26, 27, 35, 53, 58, 66, 70, 88, 104, 121, 125, 136, 141, 155, 
-                        169, 206, 217, 242, 268, 283, 344, 349, 485, 509, 704, 724, 217, 242, 268, 283, 
-                        344, 349, 485, 509, 704, 724, 232, 225, 682}
-        
-        # Known hard problems
-        hard_problems = {10, 23, 25, 30, 37, 42, 51, 72, 76, 84, 124, 140, 212, 239, 295, 297, 
-                        684, 685, 1135, 1489, 1579, 1697, 1349, 778}
-        
+        # Cached on the problem number as written, so int() only runs once per number
+        problem_num = int(number)
         # Special ranges - typically easy problems are low numbers, hard are high complexity
-        if problem_num in easy_problems or problem_num < 50:
+        if problem_num < 50 or problem_num in _EASY_PROBLEMS:
             return "easy"
-        elif problem_num in hard_problems or problem_num > 1000:
+        elif problem_num > 1000 or problem_num in _HARD_PROBLEMS:
             return "hard"
         else:
             return "medium"
 
-class HTMLGenerator:
-    def __init__(self, weeks: List[Week]):
-        self.weeks = weeks
-        
-    def generate_html(self) -> str:
-        """Generate complete minimal HTML."""
-        
-        weeks_html = ""
-        for week in self.weeks:
-            weeks_html += self._generate_week_html(week)
-        
-        html_template = '''<!DOCTYPE html>
+# Escapes user-supplied text for HTML in a single translate pass
+_ESC = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'})
+
+# Week/day markup, filled with str.format_map by HTMLGenerator
+_WEEK_TMPL = '''
+        <div class="week-section" data-week="{number}">
+            <div class="week-header" onclick="toggleWeek(this)">
+                <span>Week {number}: {title}</span>
+                <span class="week-toggle">▼</span>
+            </div>
+            <div class="week-content">
+{days_html}
+            </div>
+        </div>'''
+
+_PROBLEM_ITEM_TMPL = '''
+                    <div class="problem-item" data-week="{week}" data-difficulty="{difficulty}" data-search="{search}">
+                        <input type="checkbox" class="problem-checkbox" data-id="{id}">
+                        <a href="{url}" target="_blank" class="problem-link">LC {number}: {title}</a>
+                        <span class="difficulty {difficulty}">{difficulty}</span>
+                    </div>'''
+
+_DSA_TASK_ITEM_TMPL = '''
+                    <div class="task-item" data-week="{week}" data-difficulty="task" data-search="{search}">
+                        <input type="checkbox" class="task-checkbox dsa-task" data-id="{id}">
+                        <span class="task-text">{text}</span>
+                    </div>'''
+
+_SYSTEM_TASK_ITEM_TMPL = '''
+                    <div class="task-item" data-week="{week}" data-difficulty="task" data-search="{search}">
+                        <input type="checkbox" class="task-checkbox system-task" data-type="{task_type}" data-id="{id}">
+                        <span class="task-text">{text}</span>
+                    </div>'''
+
+_DAY_TMPL = '''
+                <div class="day-section day-collapsed overview-content">
+                    <div class="day-header" onclick="toggleDay(this)">
+                        <span>{title}</span>
+                        <span>▶</span>
+                    </div>
+                    <div class="day-content">
+                        <div class="sections-grid">
+                            <div class="section dsa-section">
+                                <div class="section-title">🎯 {dsa_title}</div>
+                                {dsa_html}
+                                {goal_html}
+                            </div>
+                            <div class="section system-section">
+                                <div class="section-title">🧠 {sd_title}</div>
+                                {tasks_html}
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                <div class="day-section day-collapsed dsa-content">
+                    <div class="day-header" onclick="toggleDay(this)">
+                        <span>{title} - {dsa_title}</span>
+                        <span>▶</span>
+                    </div>
+                    <div class="day-content">
+                        <div class="section dsa-section full-width">
+                            <div class="section-title">🎯 {dsa_title}</div>
+                            {dsa_html}
+                            {goal_html}
+                        </div>
+                    </div>
+                </div>
+                <div class="day-section day-collapsed system-content">
+                    <div class="day-header" onclick="toggleDay(this)">
+                        <span>{title} - {sd_title}</span>
+                        <span>▶</span>
+                    </div>
+                    <div class="day-content">
+                        <div class="section system-section full-width">
+                            <div class="section-title">🧠 {sd_title}</div>
+                            {tasks_html}
+                        </div>
+                    </div>
+                </div>'''
+
+# Page shell; {{WEEKS_CONTENT}} is replaced with the rendered weeks
+_HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -504,6 +624,10 @@ class HTMLGenerator:
 
         .week-content {
             padding: 0;
+            /* Skip style and layout for week bodies scrolled out of view; headers
+               and collapsed or filtered-out weeks are always sized exactly */
+            content-visibility: auto;
+            contain-intrinsic-size: auto 400px;
         }
 
         .week-collapsed .week-content {
@@ -590,18 +714,18 @@ class HTMLGenerator:
         #system-tab.active ~ .container .dsa-content { display: none; }
         #system-tab.active ~ .container .system-content { display: block; }
 
-        /* Global content visibility */
-        .content-overview .overview-content { display: block; }
-        .content-overview .dsa-content { display: none; }
-        .content-overview .system-content { display: none; }
+        /* Global content visibility, keyed on body[data-tab] */
+        body[data-tab="overview"] .overview-content { display: block; }
+        body[data-tab="overview"] .dsa-content { display: none; }
+        body[data-tab="overview"] .system-content { display: none; }
 
-        .content-dsa .overview-content { display: none; }
-        .content-dsa .dsa-content { display: block; }
-        .content-dsa .system-content { display: none; }
+        body[data-tab="dsa"] .overview-content { display: none; }
+        body[data-tab="dsa"] .dsa-content { display: block; }
+        body[data-tab="dsa"] .system-content { display: none; }
 
-        .content-system .overview-content { display: none; }
-        .content-system .dsa-content { display: none; }
-        .content-system .system-content { display: block; }
+        body[data-tab="system"] .overview-content { display: none; }
+        body[data-tab="system"] .dsa-content { display: none; }
+        body[data-tab="system"] .system-content { display: block; }
 
         .section-title {
             font-size: 13px;
@@ -783,7 +907,7 @@ class HTMLGenerator:
         }
     </style>
 </head>
-<body class="content-overview">
+<body data-tab="overview">
     <div class="container">
         <div class="header">
             <h1>LeetCode Tracker</h1>
@@ -919,20 +1043,20 @@ class HTMLGenerator:
 
         <div class="filters">
             <div class="filters-row">
-                <input type="text" class="search-input" id="search" placeholder="Search problems..." oninput="filterContent()">
-                <select class="filter-select" id="difficulty-filter" onchange="filterContent()">
+                <input type="text" class="search-input" id="search" placeholder="Search problems..." oninput="scheduleFilter()">
+                <select class="filter-select" id="difficulty-filter" onchange="scheduleFilter()">
                     <option value="">All Difficulties</option>
                     <option value="easy">Easy</option>
                     <option value="medium">Medium</option>
                     <option value="hard">Hard</option>
                     <option value="task">Tasks</option>
                 </select>
-                <select class="filter-select" id="status-filter" onchange="filterContent()">
+                <select class="filter-select" id="status-filter" onchange="scheduleFilter()">
                     <option value="">All Status</option>
                     <option value="completed">Completed</option>
                     <option value="pending">Pending</option>
                 </select>
-                <select class="filter-select" id="week-filter" onchange="filterContent()">
+                <select class="filter-select" id="week-filter" onchange="scheduleFilter()">
                     <option value="">All Weeks</option>
                     <option value="1">Week 1</option>
                     <option value="2">Week 2</option>
@@ -952,7 +1076,9 @@ class HTMLGenerator:
             </div>
         </div>
 
+        <div id="weeks">
         {{WEEKS_CONTENT}}
+        </div>
 
         <!-- GitHub Sync Modal -->
         <div id="github-modal" class="modal" style="display: none;">
@@ -980,10 +1106,34 @@ class HTMLGenerator:
         // GitHub Sync Configuration
         let githubToken = localStorage.getItem('github-token');
         let gistId = localStorage.getItem('gist-id');
-        let autoSyncInterval;
+        let lastSyncedKeys = null;
+
+        // Fixed elements, looked up once
+        const UI = Object.fromEntries([
+            'github-modal', 'github-token', 'sync-status', 'sync-btn', 'weeks',
+            'search', 'difficulty-filter', 'status-filter', 'week-filter',
+            'total-problems', 'completed-problems', 'total-tasks', 'completed-tasks', 'dsa-rate', 'sd-rate', 'dsa-progress', 'sd-progress',
+            'dsa-total', 'dsa-completed', 'dsa-easy', 'dsa-medium', 'dsa-hard', 'dsa-completion-rate', 'dsa-only-progress',
+            'system-total', 'system-completed', 'system-watch', 'system-design', 'system-bonus', 'system-completion-rate', 'system-only-progress'
+        ].map(id => [id, document.getElementById(id)]));
+
+        // Per-tab checkbox counters, kept current by the change listener
+        const TAB_VIEWS = {
+            'overview-tab': '.overview-content',
+            'dsa-tab': '.dsa-content',
+            'system-tab': '.system-content'
+        };
+        const tabStats = {};
+        const checkboxStats = new WeakMap();
+        let activeTab = 'overview-tab';
+
+        // Saved-progress keys of every checked checkbox, kept alongside the counters
+        // so saving never has to walk the DOM
+        const checkedKeys = new Set();
 
         // Initialize
         document.addEventListener('DOMContentLoaded', function() {
+            indexStats();
             updateStats();
             loadProgress();
             
@@ -1000,30 +1150,81 @@ class HTMLGenerator:
             
             // Update tab content
             document.querySelectorAll('.tab-content').forEach(content => content.classList.remove('active'));
-            document.getElementById(tabName + '-tab').classList.add('active');
+            activeTab = tabName + '-tab';
+            document.getElementById(activeTab).classList.add('active');
             
-            // Update body class for content visibility
-            document.body.className = 'content-' + tabName;
+            // Content visibility follows the body's data-tab attribute
+            document.body.dataset.tab = tabName;
             
-            // Update stats for the new tab
-            setTimeout(() => updateStats(), 10); // Small delay to ensure content visibility is updated
+            // Update stats for the new tab; counters are already current
+            updateStats();
         }
 
         // GitHub API Functions
-        async function createGist(data) {
-            const response = await fetch('https://api.github.com/gists', {
+        // Shared request defaults; keepalive lets an in-flight sync complete while the page unloads
+        // Transient GitHub failures are retried with exponential backoff (250ms, 500ms, ...),
+        // honouring the server's Retry-After / rate-limit reset when it is within reach.
+        // Rate-limited requests were rejected outright and are always retried; gateway
+        // errors may arrive after the work was done, so POST (creating a gist) is not
+        // retried on those
+        const GH_SERVER_ERRORS = new Set([500, 502, 503, 504]);
+        const GH_MAX_RETRIES = 4;
+        const GH_MAX_RETRY_DELAY = 60000;
+
+        function ghRetryDelay(response, attempt) {
+            const retryAfter = Number(response.headers.get('Retry-After'));
+            if (retryAfter > 0) return retryAfter * 1000;
+            
+            const reset = Number(response.headers.get('X-RateLimit-Reset'));
+            if (reset > 0 && response.headers.get('X-RateLimit-Remaining') === '0') {
+                return Math.max(0, reset * 1000 - Date.now());
+            }
+            return 250 * 2 ** attempt;
+        }
+
+        // onRetry(rateLimited) lets the caller report a pending retry, e.g. in the sync status
+        async function ghFetch(url, { onRetry, ...options } = {}) {
+            const retryServerErrors = (options.method || 'GET') !== 'POST';
+            
+            for (let attempt = 0; ; attempt++) {
+                const response = await fetch(url, {
+                    ...options,
+                    keepalive: true,
+                    headers: {
+                        'Accept': 'application/vnd.github+json',
+                        'Authorization': `token ${githubToken}`,
+                        ...options.headers
+                    }
+                });
+                
+                // A 403 is a rate limit when the primary quota is spent or, for
+                // GitHub's secondary limits, when it carries a Retry-After
+                const rateLimited = response.status === 429 ||
+                    (response.status === 403 && (response.headers.get('X-RateLimit-Remaining') === '0' ||
+                                                 response.headers.has('Retry-After')));
+                const serverError = retryServerErrors && GH_SERVER_ERRORS.has(response.status);
+                if (attempt >= GH_MAX_RETRIES || !(rateLimited || serverError)) {
+                    return response;
+                }
+                
+                const delay = ghRetryDelay(response, attempt);
+                if (delay > GH_MAX_RETRY_DELAY) return response;
+                
+                if (onRetry) onRetry(rateLimited);
+                await new Promise(resolve => setTimeout(resolve, delay));
+            }
+        }
+
+        async function createGist(content, onRetry) {
+            const response = await ghFetch('https://api.github.com/gists', {
+                onRetry,
                 method: 'POST',
-                headers: {
-                    'Authorization': `token ${githubToken}`,
-                    'Content-Type': 'application/json',
-                },
+                headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
                     description: 'LeetCode 100-Day Tracker Progress',
                     public: false,
                     files: {
-                        'leetcode-progress.json': {
-                            content: JSON.stringify(data, null, 2)
-                        }
+                        'leetcode-progress.json': { content }
                     }
                 })
             });
@@ -1032,18 +1233,14 @@ class HTMLGenerator:
             return await response.json();
         }
 
-        async function updateGist(gistId, data) {
-            const response = await fetch(`https://api.github.com/gists/${gistId}`, {
+        async function updateGist(gistId, content, onRetry) {
+            const response = await ghFetch(`https://api.github.com/gists/${gistId}`, {
+                onRetry,
                 method: 'PATCH',
-                headers: {
-                    'Authorization': `token ${githubToken}`,
-                    'Content-Type': 'application/json',
-                },
+                headers: { 'Content-Type': 'application/json' },
                 body: JSON.stringify({
                     files: {
-                        'leetcode-progress.json': {
-                            content: JSON.stringify(data, null, 2)
-                        }
+                        'leetcode-progress.json': { content }
                     }
                 })
             });
@@ -1053,9 +1250,7 @@ class HTMLGenerator:
         }
 
         async function loadFromGist(gistId) {
-            const response = await fetch(`https://api.github.com/gists/${gistId}`, {
-                headers: { 'Authorization': `token ${githubToken}` }
-            });
+            const response = await ghFetch(`https://api.github.com/gists/${gistId}`);
             
             if (!response.ok) throw new Error(`GitHub API error: ${response.status}`);
             
@@ -1066,59 +1261,122 @@ class HTMLGenerator:
 
         // Sync Functions
         function setupAutoSync() {
-            const syncStatus = document.getElementById('sync-status');
-            const syncBtn = document.getElementById('sync-btn');
+            const syncStatus = UI['sync-status'];
+            const syncBtn = UI['sync-btn'];
             
             syncStatus.className = 'sync-status sync-connected';
             syncStatus.innerHTML = '<span>●</span> Synced';
             syncBtn.textContent = '☁️ Auto Sync';
             
-            // Auto-sync every 30 seconds
-            autoSyncInterval = setInterval(async () => {
-                try {
-                    await syncProgress();
-                } catch (error) {
-                    console.log('Auto-sync failed:', error);
-                }
-            }, 30000);
+            // Changes are pushed by scheduleSync() as they happen; nothing to poll
         }
 
-        async function syncProgress() {
+        // At most one gist request is in flight; a sync requested meanwhile
+        // runs once, after the current one settles
+        let syncInFlight = null;
+        let syncQueued = false;
+
+        function syncProgress() {
             if (!githubToken) {
-                document.getElementById('github-modal').style.display = 'block';
-                return;
+                UI['github-modal'].style.display = 'block';
+                return Promise.resolve();
+            }
+            
+            if (syncInFlight) {
+                syncQueued = true;
+                return syncInFlight;
             }
+            
+            syncInFlight = pushProgress().finally(() => {
+                syncInFlight = null;
+                if (syncQueued) {
+                    syncQueued = false;
+                    syncProgress();
+                }
+            });
+            return syncInFlight;
+        }
 
+        async function pushProgress() {
             try {
                 const data = getCurrentProgress();
+                
+                // Skip the PATCH when the gist already holds this progress
+                const keys = data.checked.join();
+                if (gistId && keys === lastSyncedKeys) return;
                 data.lastSync = new Date().toISOString();
                 
+                // Serialized once for the gist and, if needed, the localStorage fallback
+                const content = stringifyProgress(data);
+                
+                const showRetry = rateLimited => {
+                    UI['sync-status'].innerHTML = rateLimited
+                        ? '<span>●</span> Rate limited — retrying'
+                        : '<span>●</span> Retrying…';
+                };
+                
                 if (gistId) {
-                    await updateGist(gistId, data);
+                    await updateGist(gistId, content, showRetry);
                 } else {
-                    const result = await createGist(data);
+                    const result = await createGist(content, showRetry);
                     gistId = result.id;
                     localStorage.setItem('gist-id', gistId);
                 }
+                lastSyncedKeys = keys;
                 
-                // Save locally too
-                localStorage.setItem('leetcode-tracker-progress', JSON.stringify(data));
+                // Save locally too, unless checkboxes changed while the request was in
+                // flight; the pending idle save then holds that newer state and is kept
+                if (getCurrentProgress().checked.join() === keys) {
+                    cancelIdle(saveHandle);
+                    saveHandle = null;
+                    saveProgressData(data, content);
+                }
                 
                 // Update sync status briefly
-                const syncStatus = document.getElementById('sync-status');
-                const originalText = syncStatus.innerHTML;
+                const syncStatus = UI['sync-status'];
+                syncStatus.className = 'sync-status sync-connected';
                 syncStatus.innerHTML = '<span>●</span> Synced';
                 
             } catch (error) {
                 console.error('Sync failed:', error);
-                const syncStatus = document.getElementById('sync-status');
+                const syncStatus = UI['sync-status'];
                 syncStatus.className = 'sync-status sync-disconnected';
                 syncStatus.innerHTML = '<span>●</span> Sync Failed';
             }
         }
 
+        // Write-behind sync: toggles made within two seconds of each other share one PATCH
+        let syncTimer = null;
+        let syncPending = false;
+
+        function scheduleSync() {
+            if (!githubToken) return;
+            syncPending = true;
+            clearTimeout(syncTimer);
+            syncTimer = setTimeout(flushSync, 2000);
+        }
+
+        function flushSync() {
+            clearTimeout(syncTimer);
+            if (!syncPending) return;
+            syncPending = false;
+            syncProgress();
+        }
+
+        // Save and push any pending changes before the page is hidden or closed;
+        // ghFetch's keepalive lets the request outlive the page
+        function flushPending() {
+            flushProgress();
+            flushSync();
+        }
+
+        document.addEventListener('visibilitychange', () => {
+            if (document.visibilityState === 'hidden') flushPending();
+        });
+        window.addEventListener('pagehide', flushPending);
+
         async function setupSync() {
-            const token = document.getElementById('github-token').value.trim();
+            const token = UI['github-token'].value.trim();
             
             if (!token) {
                 alert('Please enter your GitHub token');
@@ -1127,7 +1385,7 @@ class HTMLGenerator:
 
             try {
                 // Test the token
-                const response = await fetch('https://api.github.com/user', {
+                const response = await ghFetch('https://api.github.com/user', {
                     headers: { 'Authorization': `token ${token}` }
                 });
                 
@@ -1151,12 +1409,13 @@ class HTMLGenerator:
             localStorage.removeItem('github-token');
             localStorage.removeItem('gist-id');
             
-            if (autoSyncInterval) {
-                clearInterval(autoSyncInterval);
-            }
+            lastSyncedKeys = null;
+            syncPending = false;
+            syncQueued = false;
+            clearTimeout(syncTimer);
             
-            const syncStatus = document.getElementById('sync-status');
-            const syncBtn = document.getElementById('sync-btn');
+            const syncStatus = UI['sync-status'];
+            const syncBtn = UI['sync-btn'];
             
             syncStatus.className = 'sync-status sync-disconnected';
             syncStatus.innerHTML = '<span>●</span> Offline';
@@ -1166,13 +1425,9 @@ class HTMLGenerator:
         }
 
         // UI Functions
+        // The week arrow is rotated by CSS from the week-collapsed class
         function toggleWeek(header) {
-            const section = header.parentElement;
-            const content = section.querySelector('.week-content');
-            const toggle = header.querySelector('.week-toggle');
-            
-            section.classList.toggle('week-collapsed');
-            toggle.textContent = section.classList.contains('week-collapsed') ? '▶' : '▼';
+            header.parentElement.classList.toggle('week-collapsed');
         }
 
         function toggleDay(header) {
@@ -1182,183 +1437,340 @@ class HTMLGenerator:
             section.classList.toggle('day-collapsed');
         }
 
-        function expandAll() {
-            document.querySelectorAll('.week-section').forEach(week => {
-                week.classList.remove('week-collapsed');
-                week.querySelector('.week-toggle').textContent = '▼';
-            });
+        // Sections never change after load, so expand/collapse reuse one lookup
+        let sectionCache = null;
+
+        function getSections() {
+            if (!sectionCache) {
+                sectionCache = {
+                    weeks: Array.from(document.querySelectorAll('.week-section')),
+                    days: Array.from(document.querySelectorAll('.day-section'))
+                };
+            }
+            return sectionCache;
+        }
+
+        function setAllCollapsed(collapsed) {
+            const { weeks, days } = getSections();
             
-            document.querySelectorAll('.day-section').forEach(day => {
-                day.classList.remove('day-collapsed');
+            requestAnimationFrame(() => {
+                for (const week of weeks) week.classList.toggle('week-collapsed', collapsed);
+                for (const day of days) day.classList.toggle('day-collapsed', collapsed);
             });
         }
 
+        function expandAll() {
+            setAllCollapsed(false);
+        }
+
         function collapseAll() {
-            document.querySelectorAll('.week-section').forEach(week => {
-                week.classList.add('week-collapsed');
-                week.querySelector('.week-toggle').textContent = '▶';
-            });
-            
-            document.querySelectorAll('.day-section').forEach(day => {
-                day.classList.add('day-collapsed');
-            });
+            setAllCollapsed(true);
+        }
+
+        // Walk every checkbox once, grouping totals and completions by tab view.
+        // Call again after bulk changes to checkbox state (e.g. loading progress).
+        function indexStats() {
+            checkedKeys.clear();
+            for (const [tabId, view] of Object.entries(TAB_VIEWS)) {
+                const stats = {
+                    // Saved progress keys are this prefix plus the checkbox's data-id,
+                    // so each tab keeps its own copy of a day's state
+                    prefix: tabId.charAt(0) + ':',
+                    dsaTotal: 0, dsaCompleted: 0, sdTotal: 0, sdCompleted: 0,
+                    easy: document.querySelectorAll(view + ' .difficulty.easy').length,
+                    medium: document.querySelectorAll(view + ' .difficulty.medium').length,
+                    hard: document.querySelectorAll(view + ' .difficulty.hard').length,
+                    watch: 0, design: 0, bonus: 0
+                };
+                
+                document.querySelectorAll(view + ' .problem-checkbox, ' + view + ' .task-checkbox').forEach(checkbox => {
+                    checkboxStats.set(checkbox, stats);
+                    if (checkbox.checked) checkedKeys.add(stats.prefix + checkbox.dataset.id);
+                    if (checkbox.classList.contains('system-task')) {
+                        stats.sdTotal++;
+                        if (checkbox.checked) stats.sdCompleted++;
+                        stats[checkbox.dataset.type]++;
+                    } else {
+                        stats.dsaTotal++;
+                        if (checkbox.checked) stats.dsaCompleted++;
+                    }
+                });
+                
+                tabStats[tabId] = stats;
+            }
         }
 
+        // Write every stat for the active tab, including the totals that only
+        // change when the tab changes
         function updateStats() {
-            // Determine which content is currently visible
-            const activeTab = document.querySelector('.tab-content.active').id;
-            let contentSelector = '';
+            const stats = tabStats[activeTab];
+            if (!stats) return;
             
-            if (activeTab === 'overview-tab') {
-                contentSelector = '.overview-content';
-            } else if (activeTab === 'dsa-tab') {
-                contentSelector = '.dsa-content';
-            } else if (activeTab === 'system-tab') {
-                contentSelector = '.system-content';
-            }
+            // Overview tab totals
+            UI['total-problems'].textContent = stats.dsaTotal;
+            UI['total-tasks'].textContent = stats.sdTotal;
             
-            // Only count checkboxes in the active content
-            const dsaCheckboxes = document.querySelectorAll(contentSelector + ' .problem-checkbox');
-            const dsaCompleted = document.querySelectorAll(contentSelector + ' .problem-checkbox:checked');
-            const dsaTaskCheckboxes = document.querySelectorAll(contentSelector + ' .task-checkbox.dsa-task');
-            const dsaTaskCompleted = document.querySelectorAll(contentSelector + ' .task-checkbox.dsa-task:checked');
+            // DSA Only tab totals
+            UI['dsa-total'].textContent = stats.dsaTotal;
+            UI['dsa-easy'].textContent = stats.easy;
+            UI['dsa-medium'].textContent = stats.medium;
+            UI['dsa-hard'].textContent = stats.hard;
             
-            // System Design tracking  
-            const sdCheckboxes = document.querySelectorAll(contentSelector + ' .task-checkbox.system-task');
-            const sdCompleted = document.querySelectorAll(contentSelector + ' .task-checkbox.system-task:checked');
+            // System Design Only tab totals
+            UI['system-total'].textContent = stats.sdTotal;
+            UI['system-watch'].textContent = stats.watch;
+            UI['system-design'].textContent = stats.design;
+            UI['system-bonus'].textContent = stats.bonus;
             
-            // Overview tab stats
-            const totalDSA = dsaCheckboxes.length + dsaTaskCheckboxes.length;
-            const completedDSA = dsaCompleted.length + dsaTaskCompleted.length;
+            updateProgress();
+        }
+
+        // Write only the completion counts, rates and bars; enough after a single toggle
+        function updateProgress() {
+            const stats = tabStats[activeTab];
+            if (!stats) return;
             
-            document.getElementById('total-problems').textContent = totalDSA;
-            document.getElementById('completed-problems').textContent = completedDSA;
-            document.getElementById('total-tasks').textContent = sdCheckboxes.length;
-            document.getElementById('completed-tasks').textContent = sdCompleted.length;
+            const dsaRate = stats.dsaTotal > 0 ? Math.round((stats.dsaCompleted / stats.dsaTotal) * 100) : 0;
+            const sdRate = stats.sdTotal > 0 ? Math.round((stats.sdCompleted / stats.sdTotal) * 100) : 0;
             
-            const dsaRate = totalDSA > 0 ? Math.round((completedDSA / totalDSA) * 100) : 0;
-            const sdRate = sdCheckboxes.length > 0 ? Math.round((sdCompleted.length / sdCheckboxes.length) * 100) : 0;
+            // Overview tab
+            UI['completed-problems'].textContent = stats.dsaCompleted;
+            UI['completed-tasks'].textContent = stats.sdCompleted;
+            UI['dsa-rate'].textContent = dsaRate + '%';
+            UI['sd-rate'].textContent = sdRate + '%';
+            UI['dsa-progress'].style.width = dsaRate + '%';
+            UI['sd-progress'].style.width = sdRate + '%';
             
-            document.getElementById('dsa-rate').textContent = dsaRate + '%';
-            document.getElementById('sd-rate').textContent = sdRate + '%';
-            document.getElementById('dsa-progress').style.width = dsaRate + '%';
-            document.getElementById('sd-progress').style.width = sdRate + '%';
+            // DSA Only tab
+            UI['dsa-completed'].textContent = stats.dsaCompleted;
+            UI['dsa-completion-rate'].textContent = dsaRate + '%';
+            UI['dsa-only-progress'].style.width = dsaRate + '%';
             
-            // DSA Only tab stats
-            const easyProblems = document.querySelectorAll(contentSelector + ' .difficulty.easy').length;
-            const mediumProblems = document.querySelectorAll(contentSelector + ' .difficulty.medium').length;
-            const hardProblems = document.querySelectorAll(contentSelector + ' .difficulty.hard').length;
+            // System Design Only tab
+            UI['system-completed'].textContent = stats.sdCompleted;
+            UI['system-completion-rate'].textContent = sdRate + '%';
+            UI['system-only-progress'].style.width = sdRate + '%';
+        }
+
+        // Filter index: parallel arrays describing every problem/task item, built on first filter
+        const DIFFICULTY_CODES = { easy: 1, medium: 2, hard: 3, task: 4 };
+        let filterIndex = null;
+
+        function buildFilterIndex() {
+            // Items carry their search text, difficulty and week as data attributes
+            const weeks = Array.from(document.querySelectorAll('.week-section'));
+            const weekNumbers = weeks.map(weekSection => weekSection.dataset.week);
+            const weekIndex = new Map(weekNumbers.map((number, index) => [number, index]));
+            const items = Array.from(document.querySelectorAll('.problem-item, .task-item'));
+            const count = items.length;
             
-            document.getElementById('dsa-total').textContent = totalDSA;
-            document.getElementById('dsa-completed').textContent = completedDSA;
-            document.getElementById('dsa-easy').textContent = easyProblems;
-            document.getElementById('dsa-medium').textContent = mediumProblems;
-            document.getElementById('dsa-hard').textContent = hardProblems;
-            document.getElementById('dsa-completion-rate').textContent = dsaRate + '%';
-            document.getElementById('dsa-only-progress').style.width = dsaRate + '%';
+            const index = {
+                weeks,
+                weekNumbers,
+                text: new Array(count),
+                difficulty: new Uint8Array(count),
+                week: new Uint16Array(count),
+                items,
+                checkboxes: new Array(count)
+            };
             
-            // System Design Only tab stats
-            const watchTasks = document.querySelectorAll(contentSelector + ' .system-task[data-type="watch"]').length;
-            const designTasks = document.querySelectorAll(contentSelector + ' .system-task[data-type="design"]').length;
-            const bonusTasks = document.querySelectorAll(contentSelector + ' .system-task[data-type="bonus"]').length;
+            for (let i = 0; i < count; i++) {
+                const data = items[i].dataset;
+                index.text[i] = data.search;
+                index.difficulty[i] = DIFFICULTY_CODES[data.difficulty] || 0;
+                index.week[i] = weekIndex.get(data.week);
+                index.checkboxes[i] = items[i].querySelector('input');
+            }
             
-            document.getElementById('system-total').textContent = sdCheckboxes.length;
-            document.getElementById('system-completed').textContent = sdCompleted.length;
-            document.getElementById('system-watch').textContent = watchTasks;
-            document.getElementById('system-design').textContent = designTasks;
-            document.getElementById('system-bonus').textContent = bonusTasks;
-            document.getElementById('system-completion-rate').textContent = sdRate + '%';
-            document.getElementById('system-only-progress').style.width = sdRate + '%';
+            return index;
         }
 
         function filterContent() {
-            const search = document.getElementById('search').value.toLowerCase();
-            const difficultyFilter = document.getElementById('difficulty-filter').value;
-            const statusFilter = document.getElementById('status-filter').value;
-            const weekFilter = document.getElementById('week-filter').value;
-
-            document.querySelectorAll('.week-section').forEach(week => {
-                const weekNumber = week.dataset.week;
-                let weekVisible = false;
+            if (!filterIndex) filterIndex = buildFilterIndex();
+            const { weeks, weekNumbers, text, difficulty, week, items, checkboxes } = filterIndex;
+            
+            const search = UI['search'].value.toLowerCase();
+            const difficultyFilter = DIFFICULTY_CODES[UI['difficulty-filter'].value] || 0;
+            const statusFilter = UI['status-filter'].value;
+            const weekFilter = UI['week-filter'].value;
+            
+            const weekExcluded = weekNumbers.map(number => weekFilter !== '' && number !== weekFilter);
+            const weekVisible = new Uint8Array(weeks.length);
+            
+            for (let i = 0; i < items.length; i++) {
+                const w = week[i];
+                if (weekExcluded[w]) continue;
                 
-                if (weekFilter && weekNumber !== weekFilter) {
-                    week.classList.add('hidden');
-                    return;
-                }
-
-                // Filter LeetCode problems
-                week.querySelectorAll('.problem-item').forEach(item => {
-                    const text = item.querySelector('.problem-link').textContent.toLowerCase();
-                    const difficulty = item.querySelector('.difficulty')?.textContent.toLowerCase() || '';
-                    const isCompleted = item.querySelector('.problem-checkbox').checked;
-                    
-                    let visible = true;
-                    
-                    if (search && !text.includes(search)) visible = false;
-                    if (difficultyFilter && difficulty !== difficultyFilter) visible = false;
-                    if (statusFilter === 'completed' && !isCompleted) visible = false;
-                    if (statusFilter === 'pending' && isCompleted) visible = false;
-                    
-                    item.style.display = visible ? 'flex' : 'none';
-                    if (visible) weekVisible = true;
-                });
+                let visible = true;
                 
-                // Filter general tasks
-                week.querySelectorAll('.task-item').forEach(item => {
-                    const text = item.querySelector('.task-text').textContent.toLowerCase();
-                    const isCompleted = item.querySelector('.task-checkbox').checked;
-                    
-                    let visible = true;
-                    
-                    if (search && !text.includes(search)) visible = false;
-                    if (difficultyFilter && difficultyFilter !== 'task' && difficultyFilter !== '') visible = false;
-                    if (statusFilter === 'completed' && !isCompleted) visible = false;
-                    if (statusFilter === 'pending' && isCompleted) visible = false;
-                    
-                    item.style.display = visible ? 'flex' : 'none';
-                    if (visible) weekVisible = true;
-                });
+                if (search && !text[i].includes(search)) visible = false;
+                else if (difficultyFilter && difficulty[i] !== difficultyFilter) visible = false;
+                else if (statusFilter === 'completed' && !checkboxes[i].checked) visible = false;
+                else if (statusFilter === 'pending' && checkboxes[i].checked) visible = false;
+                
+                items[i].classList.toggle('hidden', !visible);
+                if (visible) weekVisible[w] = 1;
+            }
+            
+            for (let w = 0; w < weeks.length; w++) {
+                weeks[w].classList.toggle('hidden', weekExcluded[w] || !weekVisible[w]);
+            }
+        }
 
-                week.classList.toggle('hidden', !weekVisible);
+        // Run at most one filter pass per animation frame while typing
+        let filterFrame = 0;
+        
+        function scheduleFilter() {
+            if (filterFrame) return;
+            filterFrame = requestAnimationFrame(() => {
+                filterFrame = 0;
+                filterContent();
             });
         }
 
+        // Progress is the list of checked keys (view prefix + checkbox data-id),
+        // sorted so the same progress always serializes (and compares) the same
         function getCurrentProgress() {
-            const data = {
-                checkboxes: {},
+            return {
+                checked: Array.from(checkedKeys).sort(),
                 timestamp: new Date().toISOString()
             };
+        }
+
+        // The progress payload has a fixed shape whose values never need escaping
+        // (generated checkbox ids and ISO dates), so it is serialized by direct concatenation
+        function stringifyProgress(data) {
+            let json = '{"checked":[' + (data.checked.length ? '"' + data.checked.join('","') + '"' : '') +
+                '],"timestamp":"' + data.timestamp + '"';
+            if (data.lastSync) json += ',"lastSync":"' + data.lastSync + '"';
+            return json + '}';
+        }
+
+        // Apply saved states in one frame, touching only checkboxes that differ,
+        // then recount the stats once
+        function applyProgress(data) {
+            requestAnimationFrame(() => {
+                if (data.checked) {
+                    const checked = new Set(data.checked);
+                    document.querySelectorAll('input[data-id]').forEach(checkbox => {
+                        const state = checked.has(checkboxStats.get(checkbox).prefix + checkbox.dataset.id);
+                        if (checkbox.checked !== state) checkbox.checked = state;
+                    });
+                } else if (data.checkboxes) {
+                    // Older saves keyed each checkbox state by its index
+                    const checkboxes = document.querySelectorAll('.problem-checkbox, .task-checkbox');
+                    checkboxes.forEach((checkbox, index) => {
+                        const checked = data.checkboxes[index];
+                        if (checked !== undefined && checkbox.checked !== checked) {
+                            checkbox.checked = checked;
+                        }
+                    });
+                }
+                
+                indexStats();
+                updateStats();
+            });
+        }
+
+        // Local progress lives in IndexedDB (asynchronous, stored by structured clone),
+        // falling back to localStorage where IndexedDB is unavailable
+        const PROGRESS_KEY = 'leetcode-tracker-progress';
+        let progressDb = null;
+
+        function openProgressDb() {
+            if (!progressDb) {
+                progressDb = new Promise(resolve => {
+                    if (!window.indexedDB) return resolve(null);
+                    const request = indexedDB.open('leetcode-tracker', 1);
+                    request.onupgradeneeded = () => request.result.createObjectStore('kv');
+                    request.onsuccess = () => resolve(request.result);
+                    request.onerror = () => resolve(null);
+                });
+            }
+            return progressDb;
+        }
+
+        async function saveProgressData(data, json = null) {
+            const db = await openProgressDb();
+            if (!db) {
+                localStorage.setItem(PROGRESS_KEY, json || stringifyProgress(data));
+                return;
+            }
+            
+            await new Promise((resolve, reject) => {
+                const tx = db.transaction('kv', 'readwrite');
+                tx.objectStore('kv').put(data, PROGRESS_KEY);
+                tx.oncomplete = resolve;
+                tx.onerror = () => reject(tx.error);
+            });
+        }
+
+        async function readProgressData() {
+            const db = await openProgressDb();
+            const legacy = localStorage.getItem(PROGRESS_KEY);
+            if (!db) return legacy ? JSON.parse(legacy) : null;
             
-            document.querySelectorAll('.problem-checkbox, .task-checkbox').forEach((checkbox, index) => {
-                data.checkboxes[index] = checkbox.checked;
+            const data = await new Promise(resolve => {
+                const request = db.transaction('kv').objectStore('kv').get(PROGRESS_KEY);
+                request.onsuccess = () => resolve(request.result);
+                request.onerror = () => resolve(undefined);
             });
+            if (data) return data;
             
-            return data;
+            // Move progress saved by earlier versions out of localStorage
+            if (legacy) {
+                const migrated = JSON.parse(legacy);
+                await saveProgressData(migrated);
+                localStorage.removeItem(PROGRESS_KEY);
+                return migrated;
+            }
+            return null;
         }
 
-        function loadProgress() {
-            const saved = localStorage.getItem('leetcode-tracker-progress');
-            if (saved) {
-                const data = JSON.parse(saved);
-                
-                document.querySelectorAll('.problem-checkbox, .task-checkbox').forEach((checkbox, index) => {
-                    if (data.checkboxes && data.checkboxes[index] !== undefined) {
-                        checkbox.checked = data.checkboxes[index];
-                    }
-                });
-                
-                updateStats();
+        async function loadProgress() {
+            const data = await readProgressData();
+            if (data) {
+                applyProgress(data);
             }
         }
 
+        // Coalesce rapid toggles into a single write when the browser is idle
+        const whenIdle = window.requestIdleCallback || (callback => setTimeout(callback, 200));
+        const cancelIdle = window.cancelIdleCallback || clearTimeout;
+        let saveHandle = null;
+        
+        function scheduleSave() {
+            if (saveHandle !== null) return;
+            saveHandle = whenIdle(flushProgress, { timeout: 1000 });
+        }
+
+        // Write a pending save right away instead of waiting for the idle callback
+        function flushProgress() {
+            if (saveHandle === null) return;
+            cancelIdle(saveHandle);
+            saveHandle = null;
+            saveProgressData(getCurrentProgress());
+        }
+
+        // Only cells containing a quote, comma or line break need quoting, and only
+        // cells that contain a quote need the replace pass
+        const CSV_SPECIAL = /[",\\r\\n]/;
+        
+        function csvCell(value) {
+            if (!CSV_SPECIAL.test(value)) return value;
+            return '"' + (value.indexOf('"') < 0 ? value : value.replace(/"/g, '""')) + '"';
+        }
+
         function exportToCSV() {
-            const rows = [['Week', 'Day', 'Type', 'Title', 'Difficulty', 'Completed', 'URL']];
+            // Rows are appended to a string buffer that is flushed into Blob chunks
+            const chunks = [];
+            let buffer = 'Week,Day,Type,Title,Difficulty,Completed,URL\\n';
             
             document.querySelectorAll('.week-section').forEach(week => {
-                const weekTitle = week.querySelector('.week-header').textContent.trim();
+                const weekTitle = csvCell(week.querySelector('.week-header').textContent.trim());
                 
                 week.querySelectorAll('.day-section').forEach(day => {
-                    const dayTitle = day.querySelector('.day-header').textContent.trim();
+                    const rowPrefix = weekTitle + ',' + csvCell(day.querySelector('.day-header').textContent.trim()) + ',';
                     
                     // Export LeetCode problems
                     day.querySelectorAll('.problem-item').forEach(item => {
@@ -1366,15 +1778,11 @@ class HTMLGenerator:
                         const link = item.querySelector('.problem-link');
                         const difficulty = item.querySelector('.difficulty');
                         
-                        rows.push([
-                            weekTitle,
-                            dayTitle,
-                            'LeetCode Problem',
-                            link.textContent,
-                            difficulty ? difficulty.textContent : '',
-                            checkbox.checked ? 'Yes' : 'No',
-                            link.href
-                        ]);
+                        buffer += rowPrefix + 'LeetCode Problem,' +
+                            csvCell(link.textContent) + ',' +
+                            csvCell(difficulty ? difficulty.textContent : '') + ',' +
+                            (checkbox.checked ? 'Yes' : 'No') + ',' +
+                            csvCell(link.href) + '\\n';
                     });
                     
                     // Export general tasks
@@ -1382,22 +1790,20 @@ class HTMLGenerator:
                         const checkbox = item.querySelector('.task-checkbox');
                         const text = item.querySelector('.task-text');
                         
-                        rows.push([
-                            weekTitle,
-                            dayTitle,
-                            'Task',
-                            text.textContent,
-                            'Task',
-                            checkbox.checked ? 'Yes' : 'No',
-                            ''
-                        ]);
+                        buffer += rowPrefix + 'Task,' +
+                            csvCell(text.textContent) + ',Task,' +
+                            (checkbox.checked ? 'Yes' : 'No') + ',\\n';
                     });
+                    
+                    if (buffer.length > 65536) {
+                        chunks.push(buffer);
+                        buffer = '';
+                    }
                 });
             });
+            chunks.push(buffer);
             
-            const csv = rows.map(row => row.map(cell => `"${cell}"`).join(',')).join('\\n');
-            
-            const blob = new Blob([csv], { type: 'text/csv' });
+            const blob = new Blob(chunks, { type: 'text/csv' });
             const url = URL.createObjectURL(blob);
             const a = document.createElement('a');
             a.href = url;
@@ -1409,126 +1815,140 @@ class HTMLGenerator:
         }
 
         function closeModal() {
-            document.getElementById('github-modal').style.display = 'none';
+            UI['github-modal'].style.display = 'none';
         }
 
-        // Add event listeners for auto-save and sync
-        document.addEventListener('change', function(e) {
-            if (e.target.classList.contains('problem-checkbox') || e.target.classList.contains('task-checkbox')) {
-                updateStats();
+        // Add event listeners for auto-save and sync; only the weeks hold
+        // tracker checkboxes, so filter and modal inputs never reach this
+        UI['weeks'].addEventListener('change', function(e) {
+            const stats = checkboxStats.get(e.target);
+            if (stats) {
+                const delta = e.target.checked ? 1 : -1;
+                if (e.target.classList.contains('system-task')) {
+                    stats.sdCompleted += delta;
+                } else {
+                    stats.dsaCompleted += delta;
+                }
+                updateProgress();
                 
-                // Auto-save locally
-                const data = getCurrentProgress();
-                localStorage.setItem('leetcode-tracker-progress', JSON.stringify(data));
+                const key = stats.prefix + e.target.dataset.id;
+                if (e.target.checked) checkedKeys.add(key);
+                else checkedKeys.delete(key);
+                
+                // Auto-save locally, then sync to GitHub once edits settle
+                scheduleSave();
+                scheduleSync();
             }
         });
     </script>
 </body>
 </html>'''
 
-        return html_template.replace('{{WEEKS_CONTENT}}', weeks_html)
+# Static page halves around the weeks, split once at import
+_HTML_HEAD, _, _HTML_TAIL = _HTML_TEMPLATE.partition('{{WEEKS_CONTENT}}')
+
+class HTMLGenerator:
+    def __init__(self, weeks: List[Week]):
+        self.weeks = weeks
+        
+    def generate_html(self) -> str:
+        """Generate complete minimal HTML."""
+        buffer = io.StringIO()
+        self.write_html(buffer)
+        return buffer.getvalue()
+    
+    def write_html(self, fp: TextIO) -> None:
+        """Stream the complete HTML to a writable text file."""
+        fp.write(_HTML_HEAD)
+        for week in self.weeks:
+            fp.write(self._generate_week_html(week))
+        fp.write(_HTML_TAIL)
     
     def _generate_week_html(self, week: Week) -> str:
         """Generate HTML for a single week."""
-        days_html = ""
-        for day in week.days:
-            days_html += self._generate_day_html(week.number, day)
+        days_html = "".join(self._generate_day_html(week.number, day) for day in week.days)
         
-        return f'''
-        <div class="week-section" data-week="{week.number}">
-            <div class="week-header" onclick="toggleWeek(this)">
-                <span>Week {week.number}: {week.title}</span>
-                <span class="week-toggle">▼</span>
-            </div>
-            <div class="week-content">
-{days_html}
-            </div>
-        </div>'''
+        return _WEEK_TMPL.format_map({
+            'number': week.number,
+            'title': week.title.translate(_ESC),
+            'days_html': days_html,
+        })
     
     def _generate_day_html(self, week_num: int, day: Day) -> str:
         """Generate HTML for a single day."""
         
-        # DSA Problems HTML
-        dsa_html = ""
-        for problem in day.dsa_problems:
+        # DSA Problems HTML; checkbox ids (d<day>-p<n>, d<day>-s<n>) key saved progress
+        dsa_parts = []
+        for i, problem in enumerate(day.dsa_problems):
+            item_id = f"d{day.number}-p{i}"
             if problem.number:  # LeetCode problem
-                dsa_html += f'''
-                    <div class="problem-item">
-                        <input type="checkbox" class="problem-checkbox" onchange="updateStats()">
-                        <a href="{problem.url}" target="_blank" class="problem-link">LC {problem.number}: {problem.title}</a>
-                        <span class="difficulty {problem.difficulty}">{problem.difficulty}</span>
-                    </div>'''
+                dsa_parts.append(_PROBLEM_ITEM_TMPL.format(
+                    week=week_num,
+                    id=item_id,
+                    search=f"lc {problem.number}: {problem.title}".lower().translate(_ESC),
+                    url=problem.url.translate(_ESC),
+                    number=problem.number,
+                    title=problem.title.translate(_ESC),
+                    difficulty=problem.difficulty,
+                ))
             else:  # General task
-                dsa_html += f'''
-                    <div class="task-item">
-                        <input type="checkbox" class="task-checkbox dsa-task" onchange="updateStats()">
-                        <span class="task-text">{problem.title}</span>
-                    </div>'''
+                dsa_parts.append(_DSA_TASK_ITEM_TMPL.format(
+                    week=week_num,
+                    id=item_id,
+                    search=problem.title.lower().translate(_ESC),
+                    text=problem.title.translate(_ESC),
+                ))
+        dsa_html = "".join(dsa_parts)
         
         # System Design Tasks HTML
-        tasks_html = ""
-        for task in day.system_design_tasks:
+        task_parts = []
+        for i, task in enumerate(day.system_design_tasks):
             task_type = "watch" if "Watch:" in task.description else ("bonus" if task.is_bonus else "design")
-            tasks_html += f'''
-                    <div class="task-item">
-                        <input type="checkbox" class="task-checkbox system-task" data-type="{task_type}" onchange="updateStats()">
-                        <span class="task-text">{task.description}</span>
-                    </div>'''
+            task_parts.append(_SYSTEM_TASK_ITEM_TMPL.format(
+                week=week_num,
+                id=f"d{day.number}-s{i}",
+                search=task.description.lower().translate(_ESC),
+                task_type=task_type,
+                text=task.description.translate(_ESC),
+            ))
+        tasks_html = "".join(task_parts)
         
-        # Combined view (Overview tab)
-        combined_html = f'''
-                <div class="day-section day-collapsed overview-content">
-                    <div class="day-header" onclick="toggleDay(this)">
-                        <span>{day.title}</span>
-                        <span>▶</span>
-                    </div>
-                    <div class="day-content">
-                        <div class="sections-grid">
-                            <div class="section dsa-section">
-                                <div class="section-title">🎯 {day.dsa_title}</div>
-                                {dsa_html}
-                                {f'<div class="goal-text">📌 {day.dsa_goal}</div>' if day.dsa_goal else ''}
-                            </div>
-                            <div class="section system-section">
-                                <div class="section-title">🧠 {day.system_design_title}</div>
-                                {tasks_html}
-                            </div>
-                        </div>
-                    </div>
-                </div>'''
-        
-        # DSA Only view
-        dsa_only_html = f'''
-                <div class="day-section day-collapsed dsa-content">
-                    <div class="day-header" onclick="toggleDay(this)">
-                        <span>{day.title} - {day.dsa_title}</span>
-                        <span>▶</span>
-                    </div>
-                    <div class="day-content">
-                        <div class="section dsa-section full-width">
-                            <div class="section-title">🎯 {day.dsa_title}</div>
-                            {dsa_html}
-                            {f'<div class="goal-text">📌 {day.dsa_goal}</div>' if day.dsa_goal else ''}
-                        </div>
-                    </div>
-                </div>'''
-        
-        # System Design Only view
-        system_only_html = f'''
-                <div class="day-section day-collapsed system-content">
-                    <div class="day-header" onclick="toggleDay(this)">
-                        <span>{day.title} - {day.system_design_title}</span>
-                        <span>▶</span>
-                    </div>
-                    <div class="day-content">
-                        <div class="section system-section full-width">
-                            <div class="section-title">🧠 {day.system_design_title}</div>
-                            {tasks_html}
-                        </div>
-                    </div>
-                </div>'''
+        goal_html = f'<div class="goal-text">📌 {day.dsa_goal.translate(_ESC)}</div>' if day.dsa_goal else ''
         
-        return combined_html + dsa_only_html + system_only_html
+        # Combined (Overview tab), DSA only and System Design only views
+        return _DAY_TMPL.format_map({
+            'title': day.title.translate(_ESC),
+            'dsa_title': day.dsa_title.translate(_ESC),
+            'sd_title': day.system_design_title.translate(_ESC),
+            'dsa_html': dsa_html,
+            'goal_html': goal_html,
+            'tasks_html': tasks_html,
+        })
+
+# Remembers the last generated input so unchanged runs can be skipped
+_CACHE_FILE = Path(__file__).with_name('.tracker_cache.json')
+
+def _input_hash(md_content: str) -> str:
+    """Hash the markdown together with this script's source."""
+    digest = hashlib.blake2b(md_content.encode('utf-8'), digest_size=16)
+    digest.update(Path(__file__).read_bytes())
+    return digest.hexdigest()
+
+def _read_cache() -> Dict[str, Any]:
+    """Load the generation cache, or an empty one if it is missing/corrupt."""
+    try:
+        with open(_CACHE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def _write_cache(cache: Dict[str, Any]) -> None:
+    """Best-effort save of the generation cache."""
+    try:
+        with open(_CACHE_FILE, 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError:
+        pass
 
 def main():
     """Main function to generate the elegant HTML tracker."""
@@ -1548,17 +1968,27 @@ def main():
         print(f"Error: File '{md_file}' not found.")
         sys.exit(1)
     
+    output_file = "leetcode_tracker.html"
+    
+    # Skip regeneration when neither the plan nor this script has changed
+    input_hash = _input_hash(md_content)
+    output_path = str(Path(output_file).resolve())
+    cached = _read_cache()
+    if cached.get('input_hash') == input_hash and cached.get('output') == output_path \
+            and Path(output_path).exists():
+        print(f"✅ '{output_file}' is up to date with '{md_file}'.")
+        return
+    
     parser = MarkdownParser(md_content)
     weeks = parser.parse()
     
     print(f"✨ Parsed {len(weeks)} weeks with {sum(len(week.days) for week in weeks)} days total.")
     
     generator = HTMLGenerator(weeks)
-    html_content = generator.generate_html()
     
-    output_file = "leetcode_tracker.html"
     with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        generator.write_html(f)
+    _write_cache({'input_hash': input_hash, 'output': output_path})
     
     print(f"🚀 Generated elegant tracker: {output_file}")
     print(f"📊 Total problems: {sum(len(day.dsa_problems) for week in weeks for day in week.days)}")